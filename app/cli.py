@@ -332,7 +332,8 @@ async def _test_watch(config_paths: dict, watch_name: str, dry_run: bool):
         browser_manager = BrowserManager(
             headless=global_config.headless,
             user_agent=global_config.user_agent,
-            concurrency=1
+            concurrency=1,
+            user_data_dir=global_config.browser_user_data_dir
         )
         
         scraper = VintedScraper(
@@ -467,7 +468,8 @@ async def _test_domain(config_paths: dict, domain: str):
         browser_manager = BrowserManager(
             headless=global_config.headless,
             user_agent=global_config.user_agent,
-            concurrency=1
+            concurrency=1,
+            user_data_dir=global_config.browser_user_data_dir
         )
         
         scraper = VintedScraper(
@@ -28,6 +28,8 @@ class GlobalConfig:
     # Browser settings
     user_agent: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
     headless: bool = True
+    # Persistent profile for the one-shot test-watch/test-domain commands only
+    browser_user_data_dir: Optional[str] = None
     
     # Delay settings (in milliseconds)
     min_delay_ms: int = 800
@@ -58,6 +60,7 @@ class GlobalConfig:
             max_pages_per_poll=int(os.getenv('MAX_PAGES_PER_POLL', '2')),
             user_agent=os.getenv('USER_AGENT', cls.user_agent),
             headless=os.getenv('HEADLESS', 'true').lower() == 'true',
+            browser_user_data_dir=os.getenv('BROWSER_USER_DATA_DIR'),
             min_delay_ms=int(os.getenv('MIN_DELAY_MS', '800')),
             max_delay_ms=int(os.getenv('MAX_DELAY_MS', '2200')),
             currency_api_url=os.getenv('CURRENCY_API_URL'),
@@ -9,7 +9,7 @@ from uuid import uuid4
 import json
 
 
-@dataclass
+@dataclass(slots=True)
 class Watch:
     """Represents a watch configuration for monitoring Vinted listings."""
     
@@ -72,7 +72,7 @@ class Watch:
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class Listing:
     """Represents a Vinted listing."""
     
@@ -504,8 +504,11 @@ class WatchScheduler:
             True if listing passes all filters, False otherwise
         """
         try:
-            # Price filter (with currency conversion if needed)
-            if not await self._check_price_filter(watch, listing):
+            # Price filter; only await the converter on a currency mismatch
+            if listing.price_currency == watch.currency:
+                if not self._check_price_filter_sync(watch, listing):
+                    return False
+            elif not await self._check_price_filter(watch, listing):
                 return False
             
             # Seller filters
@@ -527,7 +530,7 @@ class WatchScheduler:
         
         # If currencies match, direct comparison
         if listing_currency == watch_currency:
-            return listing_price <= watch_max_price
+            return WatchScheduler._check_price_filter_sync(watch, listing)
         
         # Try currency conversion if converter is available
         if self.currency_converter:
@@ -547,18 +550,32 @@ class WatchScheduler:
         logger.debug(f"Skipping listing due to currency mismatch: {listing_currency} vs {watch_currency}")
         return False
     
+    @staticmethod
+    def _check_price_filter_sync(watch: Watch, listing: Listing) -> bool:
+        """Check listing price against watch limit when both use the same currency."""
+        return listing.price_amount <= watch.max_price
+    
     def _check_seller_filters(self, watch: Watch, listing: Listing) -> bool:
         """Check if listing meets seller requirements."""
+        min_rating = watch.min_seller_rating
+        min_feedback = watch.min_seller_feedback_count
+        
+        # Most watches have no seller requirements
+        if min_rating is None and min_feedback is None:
+            return True
+        
         # Check minimum seller rating
-        if watch.min_seller_rating is not None:
-            if listing.seller_rating is None or listing.seller_rating < watch.min_seller_rating:
-                logger.debug(f"Listing filtered out: seller rating {listing.seller_rating} < {watch.min_seller_rating}")
+        if min_rating is not None:
+            seller_rating = listing.seller_rating
+            if seller_rating is None or seller_rating < min_rating:
+                logger.debug(f"Listing filtered out: seller rating {seller_rating} < {min_rating}")
                 return False
         
         # Check minimum seller feedback count
-        if watch.min_seller_feedback_count is not None:
-            if listing.seller_feedback_count is None or listing.seller_feedback_count < watch.min_seller_feedback_count:
-                logger.debug(f"Listing filtered out: seller feedback {listing.seller_feedback_count} < {watch.min_seller_feedback_count}")
+        if min_feedback is not None:
+            feedback_count = listing.seller_feedback_count
+            if feedback_count is None or feedback_count < min_feedback:
+                logger.debug(f"Listing filtered out: seller feedback {feedback_count} < {min_feedback}")
                 return False
         
         return True
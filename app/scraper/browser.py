@@ -14,10 +14,62 @@ from ..utils import logger, RateLimiter, ExponentialBackoff
 class BrowserManager:
     """Manages Playwright browser instances with anti-detection measures."""
     
+    _LAUNCH_ARGS = [
+        '--no-sandbox',
+        '--disable-blink-features=AutomationControlled',
+        '--disable-dev-shm-usage',
+        '--disable-gpu',
+        '--no-first-run',
+        '--no-default-browser-check',
+        '--disable-default-apps',
+        '--disable-extensions',
+        '--disable-background-timer-throttling',
+        '--disable-backgrounding-occluded-windows',
+        '--disable-renderer-backgrounding',
+        '--disable-features=TranslateUI',
+        '--disable-ipc-flooding-protection',
+        '--window-size=1920,1080'
+    ]
+    
+    _STEALTH_SCRIPT = """
+            // Remove webdriver property
+            Object.defineProperty(navigator, 'webdriver', {
+                get: () => undefined,
+            });
+            
+            // Mock plugins
+            Object.defineProperty(navigator, 'plugins', {
+                get: () => [1, 2, 3, 4, 5],
+            });
+            
+            // Mock languages
+            Object.defineProperty(navigator, 'languages', {
+                get: () => ['en-US', 'en'],
+            });
+            
+            // Mock permissions
+            const originalQuery = window.navigator.permissions.query;
+            window.navigator.permissions.query = (parameters) => (
+                parameters.name === 'notifications' ?
+                    Promise.resolve({ state: Denoted.denied }) :
+                    originalQuery(parameters)
+            );
+            
+            // Hide automation indicators
+            window.chrome = {
+                runtime: {},
+            };
+            
+            // Mock screen properties
+            Object.defineProperty(screen, 'availHeight', { get: () => 1040 });
+            Object.defineProperty(screen, 'availWidth', { get: () => 1920 });
+    """
+    
     def __init__(self, 
                  headless: bool = True,
                  user_agent: str = None,
-                 concurrency: int = 2):
+                 concurrency: int = 2,
+                 user_data_dir: Optional[str] = None):
         """
         Initialize browser manager.
         
@@ -25,19 +77,44 @@ class BrowserManager:
             headless: Run browser in headless mode
             user_agent: Custom user agent string
             concurrency: Maximum concurrent browser contexts
+            user_data_dir: Profile directory for a persistent context kept between runs
         """
         self.headless = headless
         self.user_agent = user_agent or self._get_default_user_agent()
         self.concurrency = concurrency
+        self.user_data_dir = user_data_dir
         
         self._playwright: Optional[Playwright] = None
         self._browser: Optional[Browser] = None
+        self._persistent_context: Optional[BrowserContext] = None
         self._contexts: List[BrowserContext] = []
         self._rate_limiter = RateLimiter(max_requests=concurrency, time_window=1.0)
         self._lock = asyncio.Lock()
         
         logger.info(f"Browser manager initialized (headless={headless}, concurrency={concurrency})")
     
+    def _context_options(self) -> Dict[str, Any]:
+        """Get browser context settings shared by fresh and persistent contexts."""
+        return {
+            'user_agent': self.user_agent,
+            'viewport': {'width': 1920, 'height': 1080},
+            'locale': 'en-US',
+            'timezone_id': 'America/New_York',
+            'permissions': [],
+            'extra_http_headers': {
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+                'Accept-Language': 'en-US,en;q=0.5',
+                'Accept-Encoding': 'gzip, deflate, br',
+                'DNT': '1',
+                'Connection': 'keep-alive',
+                'Upgrade-Insecure-Requests': '1',
+                'Sec-Fetch-Dest': 'document',
+                'Sec-Fetch-Mode': 'navigate',
+                'Sec-Fetch-Site': 'none',
+                'Cache-Control': 'max-age=0'
+            }
+        }
+    
     def _get_default_user_agent(self) -> str:
         """Get default user agent string."""
         return ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
@@ -46,33 +123,30 @@ class BrowserManager:
     async def start(self) -> None:
         """Start the browser."""
         async with self._lock:
-            if self._browser:
+            if self._browser or self._persistent_context:
                 logger.warning("Browser already started")
                 return
             
             try:
                 self._playwright = await async_playwright().start()
                 
-                # Launch browser with stealth settings
-                self._browser = await self._playwright.chromium.launch(
-                    headless=self.headless,
-                    args=[
-                        '--no-sandbox',
-                        '--disable-blink-features=AutomationControlled',
-                        '--disable-dev-shm-usage',
-                        '--disable-gpu',
-                        '--no-first-run',
-                        '--no-default-browser-check',
-                        '--disable-default-apps',
-                        '--disable-extensions',
-                        '--disable-background-timer-throttling',
-                        '--disable-backgrounding-occluded-windows',
-                        '--disable-renderer-backgrounding',
-                        '--disable-features=TranslateUI',
-                        '--disable-ipc-flooding-protection',
-                        '--window-size=1920,1080'
-                    ]
-                )
+                if self.user_data_dir:
+                    # Reuse the on-disk profile so HTTP cache and cookies survive restarts
+                    self._persistent_context = await self._playwright.chromium.launch_persistent_context(
+                        self.user_data_dir,
+                        headless=self.headless,
+                        args=self._LAUNCH_ARGS,
+                        **self._context_options()
+                    )
+                    await self._persistent_context.add_init_script(self._STEALTH_SCRIPT)
+                    # Forget the context if Chromium goes away on its own
+                    self._persistent_context.on("close", self._on_persistent_context_close)
+                else:
+                    # Launch browser with stealth settings
+                    self._browser = await self._playwright.chromium.launch(
+                        headless=self.headless,
+                        args=self._LAUNCH_ARGS
+                    )
                 
                 logger.info("Browser started successfully")
                 
@@ -81,6 +155,12 @@ class BrowserManager:
                 await self._cleanup()
                 raise
     
+    def _on_persistent_context_close(self, context: BrowserContext) -> None:
+        """Clear the persistent context once it has been closed."""
+        if self._persistent_context is context:
+            self._persistent_context = None
+            logger.warning("Persistent browser context closed unexpectedly")
+    
     async def stop(self) -> None:
         """Stop the browser and cleanup resources."""
         async with self._lock:
@@ -97,6 +177,15 @@ class BrowserManager:
                 logger.warning(f"Error closing context: {e}")
         self._contexts.clear()
         
+        # Close persistent context, which also shuts down its browser
+        if self._persistent_context:
+            # Clear first so the close event is not reported as unexpected
+            persistent_context, self._persistent_context = self._persistent_context, None
+            try:
+                await persistent_context.close()
+            except Exception as e:
+                logger.warning(f"Error closing persistent context: {e}")
+        
         # Close browser
         if self._browser:
             try:
@@ -126,73 +215,27 @@ class BrowserManager:
         """
         await self._rate_limiter.acquire()
         
-        if not self._browser:
+        if not self._browser and not self._persistent_context:
             raise RuntimeError("Browser not started. Call start() first.")
         
         context = None
         page = None
         
         try:
-            # Create new context with stealth settings
-            context = await self._browser.new_context(
-                user_agent=self.user_agent,
-                viewport={'width': 1920, 'height': 1080},
-                locale='en-US',
-                timezone_id='America/New_York',
-                permissions=[],
-                extra_http_headers={
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                    'Accept-Language': 'en-US,en;q=0.5',
-                    'Accept-Encoding': 'gzip, deflate, br',
-                    'DNT': '1',
-                    'Connection': 'keep-alive',
-                    'Upgrade-Insecure-Requests': '1',
-                    'Sec-Fetch-Dest': 'document',
-                    'Sec-Fetch-Mode': 'navigate',
-                    'Sec-Fetch-Site': 'none',
-                    'Cache-Control': 'max-age=0'
-                }
-            )
-            
-            # Add stealth scripts
-            await context.add_init_script("""
-                // Remove webdriver property
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined,
-                });
+            if self._persistent_context:
+                # Pages share the persistent context, which stays open until stop()
+                page = await self._persistent_context.new_page()
+            else:
+                # Create new context with stealth settings
+                context = await self._browser.new_context(**self._context_options())
                 
-                // Mock plugins
-                Object.defineProperty(navigator, 'plugins', {
-                    get: () => [1, 2, 3, 4, 5],
-                });
+                # Add stealth scripts
+                await context.add_init_script(self._STEALTH_SCRIPT)
                 
-                // Mock languages
-                Object.defineProperty(navigator, 'languages', {
-                    get: () => ['en-US', 'en'],
-                });
+                self._contexts.append(context)
                 
-                // Mock permissions
-                const originalQuery = window.navigator.permissions.query;
-                window.navigator.permissions.query = (parameters) => (
-                    parameters.name === 'notifications' ?
-                        Promise.resolve({ state: Denoted.denied }) :
-                        originalQuery(parameters)
-                );
-                
-                // Hide automation indicators
-                window.chrome = {
-                    runtime: {},
-                };
-                
-                // Mock screen properties
-                Object.defineProperty(screen, 'availHeight', { get: () => 1040 });
-                Object.defineProperty(screen, 'availWidth', { get: () => 1920 });
-            """)
-            
-            self._contexts.append(context)
-            
-            # Create page
-            page = await context.new_page()
+                # Create page
+                page = await context.new_page()
             
             # Set additional page properties
             await page.set_extra_http_headers({
@@ -363,12 +406,16 @@ class BrowserManager:
     
     def is_running(self) -> bool:
         """Check if browser is running."""
+        if self._persistent_context is not None:
+            # Cleared by the context's close event if Chromium exits
+            return True
         return self._browser is not None and self._browser.is_connected()
     
     async def get_page_count(self) -> int:
         """Get current number of open pages across all contexts."""
         count = 0
-        for context in self._contexts:
+        contexts = self._contexts + ([self._persistent_context] if self._persistent_context else [])
+        for context in contexts:
             try:
                 count += len(context.pages)
             except Exception:
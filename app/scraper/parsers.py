@@ -104,6 +104,12 @@ class VintedParser:
         '.seller'
     ]
     
+    # Regex patterns compiled once at class load
+    DIGITS_RE = re.compile(r'(\d+)')
+    SELLER_RATING_RE = re.compile(r'(\d+\.?\d*)\s*[★⭐/]')
+    SELLER_FEEDBACK_RE = re.compile(r'\(?(\d+)\)?(?:\s*(?:reviews?|feedback|évaluations?))?')
+    LISTING_URL_RE = re.compile(r'/items?/\d+')
+    
     def __init__(self, domain: str):
         """
         Initialize parser for specific domain.
@@ -293,7 +299,7 @@ class VintedParser:
                     return value
                 elif value and 'item' in value.lower():
                     # Extract digits from attribute value
-                    match = re.search(r'(\d+)', value)
+                    match = self.DIGITS_RE.search(value)
                     if match:
                         return match.group(1)
             
@@ -384,11 +390,11 @@ class VintedParser:
                     seller_text = await seller_element.inner_text()
                     if seller_text:
                         # Try to extract rating (e.g., "4.8★" or "4.8/5")
-                        rating_match = re.search(r'(\d+\.?\d*)\s*[★⭐/]', seller_text)
+                        rating_match = self.SELLER_RATING_RE.search(seller_text)
                         rating = float(rating_match.group(1)) if rating_match else None
                         
                         # Try to extract feedback count (e.g., "(123)" or "123 reviews")
-                        feedback_match = re.search(r'\(?(\d+)\)?(?:\s*(?:reviews?|feedback|évaluations?))?', seller_text)
+                        feedback_match = self.SELLER_FEEDBACK_RE.search(seller_text)
                         feedback_count = int(feedback_match.group(1)) if feedback_match else None
                         
                         if rating is not None or feedback_count is not None:
@@ -472,5 +478,5 @@ class VintedParser:
         return (
             self.domain in url and
             ('/items/' in url or '/item/' in url) and
-            re.search(r'/items?/\d+', url) is not None
+            self.LISTING_URL_RE.search(url) is not None
         )
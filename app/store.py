@@ -16,6 +16,18 @@ from .utils import logger
 class DatabaseStore:
     """SQLite database store for Vinted monitor data."""
     
+    # Upsert that keeps the original first_seen_at of an already seen listing
+    _MARK_SEEN_SQL = """
+        INSERT OR REPLACE INTO seen_listings (
+            watch_id, listing_id, first_seen_at, last_seen_at
+        ) VALUES (
+            ?, ?, 
+            COALESCE((SELECT first_seen_at FROM seen_listings 
+                     WHERE watch_id = ? AND listing_id = ?), ?),
+            ?
+        )
+    """
+    
     def __init__(self, db_path: str = "vinted_monitor.db"):
         self.db_path = db_path
         self._connection: Optional[aiosqlite.Connection] = None
@@ -23,12 +35,22 @@ class DatabaseStore:
     
     async def initialize(self) -> None:
         """Initialize database and create tables."""
-        # Ensure database directory exists
-        db_path = Path(self.db_path)
-        db_path.parent.mkdir(parents=True, exist_ok=True)
+        # SQLite URIs ("file:...") and ":memory:" have no directory to create
+        is_uri = self.db_path.startswith("file:")
+        if not is_uri and self.db_path != ":memory:":
+            # Ensure database directory exists
+            db_path = Path(self.db_path)
+            db_path.parent.mkdir(parents=True, exist_ok=True)
         
         async with self._lock:
-            self._connection = await aiosqlite.connect(self.db_path)
+            self._connection = await aiosqlite.connect(self.db_path, uri=is_uri)
+            # WAL with synchronous=NORMAL syncs on checkpoint rather than on every
+            # commit; in-memory databases ignore the journal mode
+            await self._connection.executescript("""
+                PRAGMA journal_mode=WAL;
+                PRAGMA synchronous=NORMAL;
+                PRAGMA temp_store=MEMORY;
+            """)
             await self._create_tables()
             logger.info(f"Database initialized at {self.db_path}")
     
@@ -242,20 +264,30 @@ class DatabaseStore:
         now = datetime.utcnow().isoformat()
         
         async with self._lock:
-            await self._connection.execute("""
-                INSERT OR REPLACE INTO seen_listings (
-                    watch_id, listing_id, first_seen_at, last_seen_at
-                ) VALUES (
-                    ?, ?, 
-                    COALESCE((SELECT first_seen_at FROM seen_listings 
-                             WHERE watch_id = ? AND listing_id = ?), ?),
-                    ?
-                )
-            """, (watch_id, listing_id, watch_id, listing_id, now, now))
+            await self._connection.execute(
+                self._MARK_SEEN_SQL, (watch_id, listing_id, watch_id, listing_id, now, now)
+            )
             await self._connection.commit()
         
         logger.debug(f"Marked listing {listing_id} as seen for watch {watch_id}")
     
+    async def mark_listings_seen(self, watch_id: str, listing_ids: List[str]) -> None:
+        """Mark several listings as seen for a watch in a single transaction."""
+        if not self._connection:
+            raise RuntimeError("Database not initialized")
+        
+        now = datetime.utcnow().isoformat()
+        rows = [
+            (watch_id, listing_id, watch_id, listing_id, now, now)
+            for listing_id in listing_ids
+        ]
+        
+        async with self._lock:
+            await self._connection.executemany(self._MARK_SEEN_SQL, rows)
+            await self._connection.commit()
+        
+        logger.debug(f"Marked {len(rows)} listings as seen for watch {watch_id}")
+    
     async def get_seen_listings(self, watch_id: str) -> List[SeenListing]:
         """Get all seen listings for a watch."""
         if not self._connection:
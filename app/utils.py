@@ -4,12 +4,15 @@ Utility functions for logging, timing, and other common operations.
 
 import logging
 import json
+import re
 import random
 import asyncio
 import time
+from collections import deque
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 from pathlib import Path
+from urllib.parse import urlencode, quote
 
 
 class JSONFormatter(logging.Formatter):
@@ -104,6 +107,20 @@ async def sleep_with_jitter(min_ms: int, max_ms: int) -> None:
     await asyncio.sleep(delay)
 
 
+# Currency symbols mapping, checked before falling back to ISO codes
+_CURRENCY_SYMBOLS = {
+    '€': 'EUR',
+    '$': 'USD',
+    '£': 'GBP',
+    '¥': 'JPY',
+    'zł': 'PLN',
+    'Kč': 'CZK'
+}
+_CURRENCY_CODES = ('EUR', 'USD', 'GBP', 'JPY', 'PLN', 'CZK')
+
+_PRICE_RE = re.compile(r'(\d+(?:\.\d+)?)')
+
+
 def normalize_price(price_text: str) -> tuple[Optional[float], Optional[str]]:
     """
     Extract price amount and currency from price text.
@@ -117,42 +134,24 @@ def normalize_price(price_text: str) -> tuple[Optional[float], Optional[str]]:
     if not price_text:
         return None, None
     
-    # Clean the text
-    price_text = price_text.strip().replace('\xa0', ' ')  # Replace non-breaking space
-    
-    # Currency symbols mapping
-    currency_symbols = {
-        '€': 'EUR',
-        '$': 'USD',
-        '£': 'GBP',
-        '¥': 'JPY',
-        'zł': 'PLN',
-        'Kč': 'CZK'
-    }
-    
-    # Try to find currency symbol
+    # Try to find currency symbol, then fall back to currency codes.
+    # The marker is removed from the text before the number is extracted
     currency = None
-    for symbol, code in currency_symbols.items():
+    for symbol, code in _CURRENCY_SYMBOLS.items():
         if symbol in price_text:
             currency = code
-            price_text = price_text.replace(symbol, '').strip()
+            price_text = price_text.replace(symbol, '')
             break
-    
-    # If no symbol found, look for currency codes
-    if not currency:
-        for code in ['EUR', 'USD', 'GBP', 'JPY', 'PLN', 'CZK']:
-            if code in price_text.upper():
+    else:
+        upper_text = price_text.upper()
+        for code in _CURRENCY_CODES:
+            if code in upper_text:
                 currency = code
-                price_text = price_text.replace(code, '').replace(code.lower(), '').strip()
+                price_text = price_text.replace(code, '').replace(code.lower(), '')
                 break
     
-    # Extract numeric value
-    # Replace comma with dot for decimal separator
-    price_text = price_text.replace(',', '.')
-    
-    # Remove any remaining non-numeric characters except dots
-    import re
-    numeric_match = re.search(r'(\d+(?:\.\d+)?)', price_text)
+    # Extract numeric value, treating comma as decimal separator
+    numeric_match = _PRICE_RE.search(price_text.replace(',', '.'))
     
     if not numeric_match:
         return None, None
@@ -201,36 +200,35 @@ def truncate_text(text: str, max_length: int = 100) -> str:
 
 
 class RateLimiter:
-    """Simple rate limiter using token bucket algorithm."""
+    """Sliding window rate limiter with a hard cap per time window."""
     
     def __init__(self, max_requests: int, time_window: float):
         """
         Initialize rate limiter.
         
         Args:
-            max_requests: Maximum number of requests allowed
+            max_requests: Maximum number of requests allowed in any time window
             time_window: Time window in seconds
         """
         self.max_requests = max_requests
         self.time_window = time_window
-        self.requests = []
+        self._requests: deque = deque()  # monotonic timestamps, oldest first
     
     async def acquire(self) -> None:
         """Acquire permission to make a request, waiting if necessary."""
-        now = time.time()
-        
-        # Remove old requests outside the time window
-        self.requests = [req_time for req_time in self.requests if now - req_time < self.time_window]
-        
-        # If we're at the limit, wait
-        if len(self.requests) >= self.max_requests:
-            sleep_time = self.time_window - (now - self.requests[0])
-            if sleep_time > 0:
-                await asyncio.sleep(sleep_time)
-                return await self.acquire()  # Recursive call after waiting
-        
-        # Add current request
-        self.requests.append(now)
+        while True:
+            now = time.monotonic()
+            
+            # Drop requests that have left the time window
+            while self._requests and now - self._requests[0] >= self.time_window:
+                self._requests.popleft()
+            
+            if len(self._requests) < self.max_requests:
+                self._requests.append(now)
+                return
+            
+            # Sleep until the oldest request leaves the window
+            await asyncio.sleep(self.time_window - (now - self._requests[0]))
 
 
 class ExponentialBackoff:
@@ -262,7 +260,6 @@ class ExponentialBackoff:
 
 def sanitize_filename(filename: str) -> str:
     """Sanitize filename for safe file system usage."""
-    import re
     # Remove or replace invalid characters
     filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
     # Remove leading/trailing spaces and dots
@@ -273,6 +270,20 @@ def sanitize_filename(filename: str) -> str:
     return filename
 
 
+# Watch filter keys and the Vinted catalog query parameters they map to
+_SCALAR_SEARCH_PARAMS = (
+    ('max_price', 'price_to'),
+    ('price_from', 'price_from'),
+    ('order', 'order'),
+)
+_LIST_SEARCH_PARAMS = (
+    ('category_ids', 'catalog_ids'),
+    ('brand_ids', 'brand_ids'),
+    ('size_ids', 'size_ids'),
+    ('condition_ids', 'status_ids'),
+)
+
+
 def create_search_url(domain: str, query: str, filters: Dict[str, Any]) -> str:
     """
     Create Vinted search URL with query and filters.
@@ -285,52 +296,41 @@ def create_search_url(domain: str, query: str, filters: Dict[str, Any]) -> str:
     Returns:
         Complete search URL
     """
-    from urllib.parse import urlencode, quote
-    
-    base_url = f"https://{domain}/catalog"
-    
-    params = {
-        'search_text': query
-    }
+    params = [('search_text', query)]
     
     # Add filters
-    if 'max_price' in filters:
-        params['price_to'] = filters['max_price']
-    
-    if 'price_from' in filters:
-        params['price_from'] = filters['price_from']
-    
-    if 'order' in filters:
-        params['order'] = filters['order']
-    
-    if 'category_ids' in filters and filters['category_ids']:
-        params['catalog_ids'] = ','.join(map(str, filters['category_ids']))
-    
-    if 'brand_ids' in filters and filters['brand_ids']:
-        params['brand_ids'] = ','.join(map(str, filters['brand_ids']))
-    
-    if 'size_ids' in filters and filters['size_ids']:
-        params['size_ids'] = ','.join(map(str, filters['size_ids']))
+    for filter_key, param in _SCALAR_SEARCH_PARAMS:
+        if filter_key in filters:
+            params.append((param, filters[filter_key]))
     
-    if 'condition_ids' in filters and filters['condition_ids']:
-        params['status_ids'] = ','.join(map(str, filters['condition_ids']))
+    for filter_key, param in _LIST_SEARCH_PARAMS:
+        ids = filters.get(filter_key)
+        if ids:
+            params.append((param, ','.join(map(str, ids))))
     
     # Build URL
     query_string = urlencode(params, quote_via=quote)
-    return f"{base_url}?{query_string}"
+    return f"https://{domain}/catalog?{query_string}"
+
+
+# Pattern for Vinted item URLs: /items/123456789-item-title
+_LISTING_ID_RE = re.compile(r'/items/(\d+)')
+# Alternative pattern: data-item-id or similar
+_ITEM_ID_RE = re.compile(r'item[_-]?id[_-]?(\d+)', re.IGNORECASE)
 
 
 def extract_listing_id_from_url(url: str) -> Optional[str]:
     """Extract listing ID from Vinted URL."""
-    import re
+    if not url:
+        return None
     
-    # Pattern for Vinted item URLs: /items/123456789-item-title
-    match = re.search(r'/items/(\d+)', url)
-    if match:
-        return match.group(1)
+    # Substring check is much cheaper than running the regex on non-item URLs
+    if '/items/' in url:
+        match = _LISTING_ID_RE.search(url)
+        if match:
+            return match.group(1)
     
-    # Alternative pattern: data-item-id or similar
-    match = re.search(r'item[_-]?id[_-]?(\d+)', url, re.IGNORECASE)
+    match = _ITEM_ID_RE.search(url)
     if match:
         return match.group(1)
     
@@ -339,8 +339,6 @@ def extract_listing_id_from_url(url: str) -> Optional[str]:
 
 def is_valid_webhook_url(url: str) -> bool:
     """Validate Discord webhook URL format."""
-    import re
-    
     if not url:
         return False
     
@@ -43,7 +43,8 @@ setup(
     extras_require={
         "dev": [
             "pytest>=7.4.0",
-            "pytest-asyncio>=0.21.0",
+            "pytest-asyncio>=1.4.0",
+            "uvloop>=0.19.0; sys_platform != 'win32'",
             "pytest-mock>=3.12.0",
             "pytest-cov>=4.1.0",
             "black>=23.0.0",
@@ -6,8 +6,83 @@ Quick installation test for Vinted Monitor
 import sys
 import os
 import asyncio
+import importlib.metadata
+import re
+from functools import lru_cache
 from pathlib import Path
 
+# Distribution names for modules whose import name differs from the package on PyPI
+_DISTRIBUTION_NAMES = {
+    'yaml': 'PyYAML',
+    'dotenv': 'python-dotenv',
+    'google.generativeai': 'google-generativeai',
+    'google.auth': 'google-auth',
+}
+
+def _check_module(module):
+    """Check that a module's package is installed without importing it, return error or None"""
+    try:
+        importlib.metadata.distribution(_DISTRIBUTION_NAMES.get(module, module))
+    except importlib.metadata.PackageNotFoundError:
+        return f"No module named '{module}'"
+    return None
+
+# Keys test_configuration() looks for in .env, matched in a single pass.
+# Accepts the same "export KEY = value" forms python-dotenv does
+_ENV_KEY_RE = re.compile(
+    rb"^[ \t]*(?:export[ \t]+)?"
+    rb"(DISCORD_WEBHOOK_URL|OPENAI_API_KEY|ANTHROPIC_API_KEY|GEMINI_API_KEY)"
+    rb"[ \t]*=(.*)$",
+    re.MULTILINE
+)
+
+_AI_KEYS = {b'OPENAI_API_KEY', b'ANTHROPIC_API_KEY', b'GEMINI_API_KEY'}
+
+def _parse_env_keys(env_data):
+    """Return {key: value} for the keys in _ENV_KEY_RE found in raw .env bytes"""
+    # Editors on Windows may save .env with a UTF-8 BOM
+    if env_data.startswith(b'\xef\xbb\xbf'):
+        env_data = env_data[3:]
+    return {m.group(1): m.group(2).strip().strip(b'"\'') for m in _ENV_KEY_RE.finditer(env_data)}
+
+@lru_cache(maxsize=None)
+def _path_exists(path):
+    """Check if a path exists, caching the result for the rest of the run"""
+    return Path(path).exists()
+
+def _find_existing_files(file_paths):
+    """Return the subset of file_paths that exist, scanning each parent directory once"""
+    by_parent = {}
+    for file_path in file_paths:
+        by_parent.setdefault(Path(file_path).parent, []).append(file_path)
+    
+    existing = set()
+    for parent, paths in by_parent.items():
+        try:
+            with os.scandir(parent) as entries:
+                names = {entry.name for entry in entries}
+        except OSError:
+            # Parent directory missing, so none of its files exist
+            continue
+        existing.update(p for p in paths if Path(p).name in names)
+    
+    return existing
+
+def _playwright_browsers_path():
+    """Locate the directory Playwright installs its browsers into"""
+    env_path = os.environ.get('PLAYWRIGHT_BROWSERS_PATH')
+    if env_path == '0':
+        # Browsers are installed inside the playwright package itself
+        import playwright
+        return Path(playwright.__file__).parent / 'driver' / 'package' / '.local-browsers'
+    if env_path:
+        return Path(env_path)
+    if sys.platform == 'win32':
+        return Path(os.environ.get('LOCALAPPDATA', Path.home() / 'AppData' / 'Local')) / 'ms-playwright'
+    if sys.platform == 'darwin':
+        return Path.home() / 'Library' / 'Caches' / 'ms-playwright'
+    return Path(os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache')) / 'ms-playwright'
+
 def test_imports():
     """Test if all required modules can be imported"""
     print("🧪 Testing Python imports...")
@@ -30,11 +105,11 @@ def test_imports():
     failed_imports = []
     
     for module in required_modules:
-        try:
-            __import__(module)
+        error = _check_module(module)
+        if error is None:
             print(f"   ✅ {module}")
-        except ImportError as e:
-            print(f"   ❌ {module} - {e}")
+        else:
+            print(f"   ❌ {module} - {error}")
             failed_imports.append(module)
     
     if failed_imports:
@@ -70,9 +145,10 @@ def test_app_structure():
     ]
     
     missing_files = []
+    existing_files = _find_existing_files(required_files)
     
     for file_path in required_files:
-        if Path(file_path).exists():
+        if file_path in existing_files:
             print(f"   ✅ {file_path}")
         else:
             print(f"   ❌ {file_path}")
@@ -92,14 +168,13 @@ def test_configuration():
     config_ok = True
     
     # Check .env file
-    if Path('.env').exists():
+    if _path_exists('.env'):
         print("   ✅ .env file exists")
         
-        with open('.env', 'r') as f:
-            env_content = f.read()
+        env_values = _parse_env_keys(Path('.env').read_bytes())
             
-        if 'DISCORD_WEBHOOK_URL=' in env_content:
-            if 'https://discord.com/api/webhooks/' in env_content:
+        if b'DISCORD_WEBHOOK_URL' in env_values:
+            if env_values[b'DISCORD_WEBHOOK_URL'].startswith(b'https://discord.com/api/webhooks/'):
                 print("   ✅ Discord webhook configured")
             else:
                 print("   ⚠️  Discord webhook not properly configured")
@@ -108,7 +183,7 @@ def test_configuration():
             print("   ❌ Discord webhook not found in .env")
             config_ok = False
             
-        if any(key in env_content for key in ['OPENAI_API_KEY=', 'ANTHROPIC_API_KEY=', 'GEMINI_API_KEY=']):
+        if _AI_KEYS & env_values.keys():
             print("   ✅ AI API key found")
         else:
             print("   ⚠️  No AI API key found (AI features will be disabled)")
@@ -118,12 +193,14 @@ def test_configuration():
         config_ok = False
     
     # Check watches.yaml
-    if Path('config/watches.yaml').exists():
+    if _path_exists('config/watches.yaml'):
         print("   ✅ watches.yaml exists")
         try:
             import yaml
+            # Prefer the libyaml-backed loader when PyYAML was built with it
+            loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
             with open('config/watches.yaml', 'r') as f:
-                watches_data = yaml.safe_load(f)
+                watches_data = yaml.load(f, Loader=loader)
             
             if 'watches' in watches_data and len(watches_data['watches']) > 0:
                 print(f"   ✅ {len(watches_data['watches'])} watches configured")
@@ -183,12 +260,8 @@ def test_playwright():
         from playwright.async_api import async_playwright
         print("   ✅ Playwright import successful")
         
-        # Check if chromium is installed
-        import subprocess
-        result = subprocess.run(['playwright', 'install', '--dry-run', 'chromium'], 
-                              capture_output=True, text=True)
-        
-        if 'chromium' in result.stdout.lower():
+        # Check if chromium is installed by looking in the browsers directory
+        if any(_playwright_browsers_path().glob('chromium-*')):
             print("   ✅ Chromium browser available")
         else:
             print("   ⚠️  Chromium might not be installed")
@@ -223,19 +296,20 @@ def main():
             print(f"❌ Test failed with exception: {e}")
             results.append(False)
     
-    # Test async components
-    try:
-        result = asyncio.run(test_app_startup())
-        results.append(result if result is not None else False)
-    except Exception as e:
-        print(f"❌ Async test failed: {e}")
-        results.append(False)
+    # Test async components on one event loop, reused for any further async checks
+    with asyncio.Runner() as runner:
+        try:
+            result = runner.run(test_app_startup())
+            results.append(result if result is not None else False)
+        except Exception as e:
+            print(f"❌ Async test failed: {e}")
+            results.append(False)
     
     print("\n" + "=" * 50)
     print("📊 TEST RESULTS")
     print("=" * 50)
     
-    passed = sum(1 for r in results if r)
+    passed = sum(results)
     total = len(results)
     
     if passed == total:
@@ -246,12 +320,12 @@ def main():
         print(f"⚠️  SOME TESTS FAILED ({passed}/{total})")
         print("\n❌ Please fix the issues above before running the monitor.")
         
-        if not Path('.env').exists():
+        if not _path_exists('.env'):
             print("\n🔧 Quick fix:")
             print("   cp .env.example .env")
             print("   # Edit .env with your Discord webhook and API keys")
         
-        if not Path('config/watches.yaml').exists():
+        if not _path_exists('config/watches.yaml'):
             print("   cp config/watches.yaml.example config/watches.yaml")
             print("   # Edit watches.yaml with your searches")
     
@@ -0,0 +1,15 @@
+"""
+Shared pytest configuration for the test suite.
+"""
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+
+if UVLOOP_AVAILABLE:
+    def pytest_asyncio_loop_factories(config, item):
+        """Run async tests on uvloop when it is installed."""
+        return {"uvloop": uvloop.new_event_loop}
@@ -0,0 +1,109 @@
+"""
+Tests for browser lifecycle management.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.scraper.browser import BrowserManager
+
+
+@pytest.fixture
+def mock_page():
+    """Create a mock Playwright page."""
+    page = MagicMock()
+    page.set_extra_http_headers = AsyncMock()
+    page.route = AsyncMock()
+    page.close = AsyncMock()
+    return page
+
+
+@pytest.fixture
+def mock_context(mock_page):
+    """Create a mock persistent browser context."""
+    context = MagicMock()
+    context.add_init_script = AsyncMock()
+    context.new_page = AsyncMock(return_value=mock_page)
+    context.close = AsyncMock()
+    return context
+
+
+@pytest.fixture
+def mock_playwright(mock_context):
+    """Patch async_playwright so start() returns a mock Playwright instance."""
+    playwright = MagicMock()
+    playwright.chromium.launch_persistent_context = AsyncMock(return_value=mock_context)
+    playwright.chromium.launch = AsyncMock()
+    playwright.stop = AsyncMock()
+    
+    with patch('app.scraper.browser.async_playwright') as async_playwright:
+        async_playwright.return_value.start = AsyncMock(return_value=playwright)
+        yield playwright
+
+
+class TestPersistentContext:
+    """Test the persistent user data directory mode."""
+    
+    @pytest.mark.asyncio
+    async def test_start_launches_persistent_context(self, mock_playwright, mock_context):
+        """Test that start() opens the profile with launch and context settings."""
+        manager = BrowserManager(user_data_dir="/tmp/profile")
+        await manager.start()
+        
+        mock_playwright.chromium.launch.assert_not_called()
+        mock_playwright.chromium.launch_persistent_context.assert_awaited_once_with(
+            "/tmp/profile",
+            headless=True,
+            args=BrowserManager._LAUNCH_ARGS,
+            **manager._context_options()
+        )
+        mock_context.add_init_script.assert_awaited_once_with(BrowserManager._STEALTH_SCRIPT)
+        assert manager.is_running() is True
+    
+    @pytest.mark.asyncio
+    async def test_get_page_reuses_shared_context(self, mock_playwright, mock_context, mock_page):
+        """Test that pages open on the shared context, which stays open."""
+        manager = BrowserManager(user_data_dir="/tmp/profile")
+        await manager.start()
+        
+        for _ in range(2):
+            async with manager.get_page() as page:
+                assert page is mock_page
+        
+        assert mock_context.new_page.await_count == 2
+        assert mock_page.close.await_count == 2
+        mock_context.close.assert_not_awaited()
+        # Stealth script is installed once on the context, not per page
+        mock_context.add_init_script.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_stop_closes_persistent_context(self, mock_playwright, mock_context):
+        """Test that stop() closes the context and Playwright."""
+        manager = BrowserManager(user_data_dir="/tmp/profile")
+        await manager.start()
+        await manager.stop()
+        
+        mock_context.close.assert_awaited_once()
+        mock_playwright.stop.assert_awaited_once()
+        assert manager.is_running() is False
+    
+    @pytest.mark.asyncio
+    async def test_unexpected_close_marks_browser_stopped(self, mock_playwright, mock_context):
+        """Test that the context close event clears the running state."""
+        manager = BrowserManager(user_data_dir="/tmp/profile")
+        await manager.start()
+        
+        event, handler = mock_context.on.call_args.args
+        assert event == "close"
+        
+        # Simulate Chromium exiting on its own
+        handler(mock_context)
+        
+        assert manager.is_running() is False
+        with pytest.raises(RuntimeError):
+            async with manager.get_page():
+                pass
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -41,6 +41,13 @@ def sample_listing():
     )
 
 
+@pytest.fixture(scope="module")
+def converter():
+    """Create one currency converter shared by the converter tests."""
+    # No API URL, so conversions use fallback rates and never open a session
+    return CurrencyConverter()
+
+
 class TestPriceFiltering:
     """Test price filtering logic."""
     
@@ -81,6 +88,14 @@ class TestPriceFiltering:
         result = await WatchScheduler._check_price_filter(scheduler, sample_watch, sample_listing)
         assert result is True
     
+    def test_price_filter_sync_same_currency(self, sample_watch, sample_listing):
+        """Test synchronous same-currency price filter."""
+        # Listing price (30) is less than max price (50)
+        assert WatchScheduler._check_price_filter_sync(sample_watch, sample_listing) is True
+        
+        sample_listing.price_amount = 60.0
+        assert WatchScheduler._check_price_filter_sync(sample_watch, sample_listing) is False
+    
     @pytest.mark.asyncio
     async def test_price_filter_different_currency_no_converter(self, sample_watch, sample_listing):
         """Test price filter with different currency and no converter - should fail."""
@@ -151,6 +166,42 @@ class TestPriceFiltering:
         assert result is False
 
 
+class TestApplyFilters:
+    """Test the combined filter entry point."""
+    
+    @pytest.mark.asyncio
+    async def test_apply_filters_same_currency_skips_converter(self, sample_watch, sample_listing):
+        """Test that same-currency listings are checked without the converter."""
+        mock_converter = AsyncMock()
+        scheduler = WatchScheduler(
+            MagicMock(), MagicMock(), MagicMock(), MagicMock(),
+            currency_converter=mock_converter
+        )
+        
+        assert await scheduler._apply_filters(sample_watch, sample_listing) is True
+        
+        sample_listing.price_amount = 60.0
+        assert await scheduler._apply_filters(sample_watch, sample_listing) is False
+        
+        mock_converter.convert.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_apply_filters_different_currency_uses_converter(self, sample_watch, sample_listing):
+        """Test that a currency mismatch goes through the converter."""
+        mock_converter = AsyncMock()
+        mock_converter.convert.return_value = 35.0  # Converted price within limit
+        scheduler = WatchScheduler(
+            MagicMock(), MagicMock(), MagicMock(), MagicMock(),
+            currency_converter=mock_converter
+        )
+        
+        sample_listing.price_currency = "USD"
+        sample_listing.price_amount = 40.0
+        
+        assert await scheduler._apply_filters(sample_watch, sample_listing) is True
+        mock_converter.convert.assert_called_once_with(40.0, "USD", "EUR")
+
+
 class TestSellerFiltering:
     """Test seller filtering logic."""
     
@@ -256,55 +307,43 @@ class TestCurrencyConverter:
     """Test currency conversion functionality."""
     
     @pytest.mark.asyncio
-    async def test_same_currency_conversion(self):
+    async def test_same_currency_conversion(self, converter):
         """Test conversion between same currencies."""
-        converter = CurrencyConverter()
-        
         result = await converter.convert(100.0, "EUR", "EUR")
         assert result == 100.0
     
     @pytest.mark.asyncio
-    async def test_fallback_rate_conversion(self):
+    async def test_fallback_rate_conversion(self, converter):
         """Test conversion using fallback rates."""
-        converter = CurrencyConverter()
-        
         # Should use fallback rate EUR -> USD (approximately 1.10)
         result = await converter.convert(100.0, "EUR", "USD")
         assert result is not None
         assert result > 100.0  # USD should be higher value
     
     @pytest.mark.asyncio
-    async def test_reverse_fallback_rate_conversion(self):
+    async def test_reverse_fallback_rate_conversion(self, converter):
         """Test conversion using reverse fallback rates."""
-        converter = CurrencyConverter()
-        
         # Should use reverse fallback rate USD -> EUR (1 / 1.10)
         result = await converter.convert(110.0, "USD", "EUR")
         assert result is not None
         assert result < 110.0  # EUR should be lower value
     
     @pytest.mark.asyncio
-    async def test_unsupported_currency_conversion(self):
+    async def test_unsupported_currency_conversion(self, converter):
         """Test conversion with unsupported currency."""
-        converter = CurrencyConverter()
-        
         result = await converter.convert(100.0, "XYZ", "EUR")
         assert result is None
     
-    def test_supported_currencies(self):
+    def test_supported_currencies(self, converter):
         """Test getting supported currencies."""
-        converter = CurrencyConverter()
-        
         currencies = converter.get_supported_currencies()
         assert "EUR" in currencies
         assert "USD" in currencies
         assert "GBP" in currencies
         assert "PLN" in currencies
     
-    def test_currency_support_check(self):
+    def test_currency_support_check(self, converter):
         """Test checking if currency is supported."""
-        converter = CurrencyConverter()
-        
         assert converter.is_currency_supported("EUR") is True
         assert converter.is_currency_supported("USD") is True
         assert converter.is_currency_supported("XYZ") is False
@@ -0,0 +1,41 @@
+"""
+Tests for the installation check script helpers.
+"""
+
+import pytest
+
+from test_installation import _parse_env_keys
+
+
+WEBHOOK = b"https://discord.com/api/webhooks/1/abc"
+
+
+class TestEnvParsing:
+    """Test .env key parsing in test_configuration()."""
+    
+    def test_plain_assignment(self):
+        """Test a plain KEY=value line."""
+        env = _parse_env_keys(b"DISCORD_WEBHOOK_URL=" + WEBHOOK + b"\n")
+        assert env[b"DISCORD_WEBHOOK_URL"] == WEBHOOK
+    
+    def test_export_prefix_and_spaces(self):
+        """Test export prefix and spaces around '=' as accepted by python-dotenv."""
+        env = _parse_env_keys(
+            b"export DISCORD_WEBHOOK_URL=" + WEBHOOK + b"\n"
+            b"OPENAI_API_KEY = 'sk-test'\n"
+        )
+        assert env[b"DISCORD_WEBHOOK_URL"] == WEBHOOK
+        assert env[b"OPENAI_API_KEY"] == b"sk-test"
+    
+    def test_utf8_bom_on_first_line(self):
+        """Test that a UTF-8 BOM does not hide the first key."""
+        env = _parse_env_keys(b"\xef\xbb\xbfDISCORD_WEBHOOK_URL=" + WEBHOOK + b"\r\n")
+        assert env[b"DISCORD_WEBHOOK_URL"] == WEBHOOK
+    
+    def test_commented_key_ignored(self):
+        """Test that a commented-out key is not picked up."""
+        assert _parse_env_keys(b"# OPENAI_API_KEY=sk-test\n") == {}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -46,6 +46,21 @@ class TestPriceNormalization:
         assert amount is None
         assert currency is None
     
+    def test_normalize_price_symbol_between_digits(self):
+        """Characterize existing behaviour for a symbol between digits.
+        
+        Removing the symbol joins the digits, so "12€50" parses as 1250.0
+        rather than the 12.50 a French listing means. Pinned so refactors
+        keep results unchanged; not an endorsement of this parse.
+        """
+        amount, currency = normalize_price("12€50")
+        assert amount == 1250.0
+        assert currency == "EUR"
+        
+        amount, currency = normalize_price("7£4")
+        assert amount == 74.0
+        assert currency == "GBP"
+    
     def test_normalize_price_with_spaces(self):
         """Test price with extra spaces."""
         amount, currency = normalize_price("  €  25.50  ")
@@ -5,34 +5,32 @@ Tests for database store operations.
 import pytest
 import pytest_asyncio
 import asyncio
-import tempfile
-import os
 from datetime import datetime, timedelta
 
 from app.store import DatabaseStore
 from app.models import Watch, SeenListing
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(scope="module")
 async def db_store():
-    """Create a temporary database store for testing."""
-    # Create temporary database file
-    temp_fd, temp_path = tempfile.mkstemp(suffix='.db')
-    os.close(temp_fd)
-    
-    store = DatabaseStore(temp_path)
+    """Create an in-memory database store shared by the module's tests."""
+    store = DatabaseStore(":memory:")
     await store.initialize()
     
     try:
         yield store
     finally:
         await store.close()
-        
-        # Clean up temporary file
-        try:
-            os.unlink(temp_path)
-        except OSError:
-            pass
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def _reset_db(db_store):
+    """Empty all tables so each test starts from a clean database."""
+    await db_store._connection.executescript("""
+        DELETE FROM notifications;
+        DELETE FROM seen_listings;
+        DELETE FROM watches;
+    """)
 
 
 @pytest.fixture
@@ -223,6 +221,32 @@ class TestSeenListingsOperations:
         is_seen = await db_store.is_listing_seen(sample_watch.id, listing_id)
         assert is_seen is True
     
+    @pytest.mark.asyncio
+    async def test_mark_listings_seen_keeps_first_seen(self, db_store, sample_watch):
+        """Test bulk marking keeps first_seen_at of an already seen listing."""
+        await db_store.save_watch(sample_watch)
+        
+        await db_store.mark_listing_seen(sample_watch.id, "listing-1")
+        before = {sl.listing_id: sl for sl in await db_store.get_seen_listings(sample_watch.id)}
+        
+        # Make sure the second write gets a later timestamp
+        await asyncio.sleep(0.01)
+        await db_store.mark_listings_seen(sample_watch.id, ["listing-1", "listing-2"])
+        after = {sl.listing_id: sl for sl in await db_store.get_seen_listings(sample_watch.id)}
+        
+        assert set(after) == {"listing-1", "listing-2"}
+        assert after["listing-1"].first_seen_at == before["listing-1"].first_seen_at
+        assert after["listing-1"].last_seen_at > before["listing-1"].last_seen_at
+    
+    @pytest.mark.asyncio
+    async def test_mark_listings_seen_empty(self, db_store, sample_watch):
+        """Test bulk marking with no listing ids is a no-op."""
+        await db_store.save_watch(sample_watch)
+        
+        await db_store.mark_listings_seen(sample_watch.id, [])
+        
+        assert await db_store.get_seen_listings(sample_watch.id) == []
+    
     @pytest.mark.asyncio
     async def test_get_seen_listings(self, db_store, sample_watch):
         """Test retrieving seen listings for a watch."""
@@ -230,8 +254,7 @@ class TestSeenListingsOperations:
         
         # Mark multiple listings as seen
         listing_ids = ["listing-1", "listing-2", "listing-3"]
-        for listing_id in listing_ids:
-            await db_store.mark_listing_seen(sample_watch.id, listing_id)
+        await db_store.mark_listings_seen(sample_watch.id, listing_ids)
         
         # Get seen listings
         seen_listings = await db_store.get_seen_listings(sample_watch.id)
@@ -248,8 +271,7 @@ class TestSeenListingsOperations:
         
         # Mark listings as seen
         listing_ids = ["listing-1", "listing-2"]
-        for listing_id in listing_ids:
-            await db_store.mark_listing_seen(sample_watch.id, listing_id)
+        await db_store.mark_listings_seen(sample_watch.id, listing_ids)
         
         # Verify they exist
         seen_listings = await db_store.get_seen_listings(sample_watch.id)
@@ -348,5 +370,21 @@ class TestDatabaseStats:
         assert stats['total_notifications'] == 1
 
 
+class TestDatabaseConnection:
+    """Test database connection options."""
+    
+    @pytest.mark.asyncio
+    async def test_uri_database_path(self, sample_watch):
+        """Test opening the store from a SQLite URI."""
+        store = DatabaseStore("file:test_uri_db?mode=memory&cache=shared")
+        await store.initialize()
+        
+        try:
+            await store.save_watch(sample_watch)
+            assert await store.get_watch(sample_watch.id) is not None
+        finally:
+            await store.close()
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,55 @@
+"""
+Tests for shared utility helpers.
+"""
+
+import pytest
+import time
+
+from app.utils import RateLimiter
+
+
+class TestRateLimiter:
+    """Test sliding window rate limiting."""
+    
+    @pytest.mark.asyncio
+    async def test_burst_within_capacity(self):
+        """Test that requests up to capacity are not delayed."""
+        limiter = RateLimiter(max_requests=3, time_window=1.0)
+        
+        start = time.monotonic()
+        for _ in range(3):
+            await limiter.acquire()
+        
+        assert time.monotonic() - start < 0.1
+    
+    @pytest.mark.asyncio
+    async def test_waits_when_window_full(self):
+        """Test that a request beyond capacity waits for the window to pass."""
+        limiter = RateLimiter(max_requests=2, time_window=0.2)
+        
+        await limiter.acquire()
+        await limiter.acquire()
+        
+        start = time.monotonic()
+        await limiter.acquire()
+        
+        # The first request leaves the 0.2s window before the third is allowed
+        assert time.monotonic() - start >= 0.18
+    
+    @pytest.mark.asyncio
+    async def test_never_exceeds_max_requests_per_window(self):
+        """Test that no time window ever holds more than max_requests acquires."""
+        limiter = RateLimiter(max_requests=5, time_window=0.3)
+        
+        timestamps = []
+        for _ in range(12):
+            await limiter.acquire()
+            timestamps.append(time.monotonic())
+        
+        # Request i and request i + max_requests must be a full window apart
+        for earlier, later in zip(timestamps, timestamps[5:]):
+            assert later - earlier >= 0.3 - 0.01
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])